@@ -4,6 +4,7 @@ import time
 import uuid
 
 import boto3
+from botocore.config import Config
 
 from releasability.releasability_check_result import ReleasabilityCheckResult
 from releasability.releasability_checks_report import ReleasabilityChecksReport
@@ -23,9 +24,15 @@ class CouldNotRetrieveReleasabilityCheckResultsException(ReleasabilityException)
 class ReleasabilityService:
     FETCH_CHECK_RESULT_TIMEOUT_SECONDS = 60 * 10
     SQS_MAX_POLLED_MESSAGES_AT_A_TIME = 10
+    SQS_MAX_DELETED_MESSAGES_AT_A_TIME = 10
     SQS_POLL_WAIT_TIME = 20
     SQS_VISIBILITY_TIMEOUT = 0  # Allows other consumers to read messages
 
+    # botocore already retries up to 5 attempts in its default legacy mode; standard mode keeps that budget but adds
+    # jitter to the backoff, retries a wider set of transient errors and stops retrying once its retry quota is spent
+    AWS_CLIENT_MAX_ATTEMPTS = 5
+    AWS_CLIENT_CONFIG = Config(retries={'total_max_attempts': AWS_CLIENT_MAX_ATTEMPTS, 'mode': 'standard'})
+
     ARN_SNS = 'arn:aws:sns'
     ARN_SQS = 'arn:aws:sqs'
 
@@ -45,19 +52,28 @@ class ReleasabilityService:
     ACK_TYPE = "ACK"
 
     session: boto3.Session
+    clients: dict
 
     def __init__(self):
         self.session = boto3.Session(region_name=releasability_aws_region)
+        self.clients = {}
         account_id = self._get_aws_account_id()
         self._define_arn_constants(releasability_aws_region, account_id)
 
     def _get_aws_account_id(self) -> str:
-        return boto3.client('sts').get_caller_identity().get('Account')
+        return boto3.client('sts', config=ReleasabilityService.AWS_CLIENT_CONFIG).get_caller_identity().get('Account')
+
+    def _get_client(self, service_name: str):
+        # Clients are reused so that the underlying HTTPS connections are kept alive between polls
+        if service_name not in self.clients:
+            self.clients[service_name] = self.session.client(service_name, config=ReleasabilityService.AWS_CLIENT_CONFIG)
+        return self.clients[service_name]
 
     def _define_arn_constants(self, aws_region: str, aws_account_id: str):
         self.TRIGGER_TOPIC_ARN = f"{ReleasabilityService.ARN_SNS}:{aws_region}:{aws_account_id}:ReleasabilityTriggerTopic"
         self.RESULT_TOPIC_ARN = f"{ReleasabilityService.ARN_SNS}:{aws_region}:{aws_account_id}:ReleasabilityResultTopic"
         self.RESULT_QUEUE_ARN = f"{ReleasabilityService.ARN_SQS}:{aws_region}:{aws_account_id}:ReleasabilityResultQueue"
+        self.RESULT_QUEUE_URL = self._arn_to_sqs_url(self.RESULT_QUEUE_ARN)
 
     def start_releasability_checks(self, organization: str, repository: str, branch: str, version: str, commit_sha: str):
         VersionHelper.validate_version(version)
@@ -74,7 +90,7 @@ class ReleasabilityService:
             revision=commit_sha,
         )
 
-        response = self.session.client("sns").publish(
+        response = self._get_client("sns").publish(
             TopicArn=self.TRIGGER_TOPIC_ARN,
             Message=str(sns_request),
         )
@@ -168,18 +184,35 @@ class ReleasabilityService:
         return relevant_messages
 
     def _delete_messages(self, messages: list):
-        sqs_client = self.session.client('sqs')
-        sqs_queue_url = self._arn_to_sqs_url(self.RESULT_QUEUE_ARN)
-        for message in messages:
-            sqs_client.delete_message(QueueUrl=sqs_queue_url, ReceiptHandle=message['ReceiptHandle'])
+        if not messages:
+            return
+
+        sqs_client = self._get_client('sqs')
+        batch_size = ReleasabilityService.SQS_MAX_DELETED_MESSAGES_AT_A_TIME
+        for start in range(0, len(messages), batch_size):
+            # Entry ids are indexes in messages so that failed entries can be mapped back to their message
+            entries = [
+                {'Id': str(index), 'ReceiptHandle': messages[index]['ReceiptHandle']}
+                for index in range(start, min(start + batch_size, len(messages)))
+            ]
+            response = sqs_client.delete_message_batch(QueueUrl=self.RESULT_QUEUE_URL, Entries=entries)
+
+            # A message that could not be deleted is received again by a later poll, where it is ignored since its
+            # check result was already recorded: warn instead of failing the releasability checks.
+            # Errors of the whole request (e.g. missing permissions) are still raised by the client.
+            for failure in response.get('Failed', []):
+                message = messages[int(failure['Id'])]
+                print(
+                    f"Warning: could not delete the {message.get('checkName')} result message from the result queue "
+                    f"(ReceiptHandle: {message['ReceiptHandle']}): {failure.get('Code')} {failure.get('Message')}"
+                )
 
     def _fetch_check_results(self) -> list:
 
-        sqs_client = self.session.client('sqs')
-        sqs_queue_url = self._arn_to_sqs_url(self.RESULT_QUEUE_ARN)
+        sqs_client = self._get_client('sqs')
 
         sqs_queue_messages = sqs_client.receive_message(
-            QueueUrl=sqs_queue_url,
+            QueueUrl=self.RESULT_QUEUE_URL,
             MaxNumberOfMessages=ReleasabilityService.SQS_MAX_POLLED_MESSAGES_AT_A_TIME,
             WaitTimeSeconds=ReleasabilityService.SQS_POLL_WAIT_TIME,
             VisibilityTimeout=ReleasabilityService.SQS_VISIBILITY_TIMEOUT,
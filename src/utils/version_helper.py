@@ -3,13 +3,14 @@ import re
 
 class VersionHelper:
     VERSION_REGEX = (
-        r'^(?:[a-zA-Z]+-)?'   # Optional ProjectName- prefix (required by sonar-scanner-azdo; see https://sonarsource.atlassian.net/browse/BUILD-5293)
+        r'(?:[a-zA-Z]+-)?'    # Optional ProjectName- prefix (required by sonar-scanner-azdo; see https://sonarsource.atlassian.net/browse/BUILD-5293)
         r'\d+\.\d+\.\d+'      # Major.Minor.Patch version
         r'(?:-M\d+)?'         # Optional -Mx suffix
         r'[.+-]'              # Separator (+ is required by sonarlint-vscode; see https://sonarsource.atlassian.net/browse/BUILD-4915)
                               # Separator (- is required by npmjs projects; npm version command do not support x.x.x.xxxx format)
-        r'(\d+)$'             # Build number in a captured group
+        r'(\d+)'              # Build number in a captured group
     )
+    VERSION_PATTERN = re.compile(VERSION_REGEX)
 
     @staticmethod
     def validate_version(version: str) -> None:
@@ -22,7 +23,7 @@ class VersionHelper:
         Raises:
         - ValueError: If the version does not match the expected format.
         """
-        if not re.match(VersionHelper.VERSION_REGEX, version):
+        if not VersionHelper.VERSION_PATTERN.fullmatch(version):
             raise ValueError(
                 'The tag must follow this pattern: [ProjectName-]Major.Minor.Patch[-Mx][.+]BuildNumber\n'
                 'Where:\n'
@@ -45,7 +46,7 @@ class VersionHelper:
         - int: The extracted build number.
         """
         VersionHelper.validate_version(version)
-        match = re.match(VersionHelper.VERSION_REGEX, version)
+        match = VersionHelper.VERSION_PATTERN.fullmatch(version)
         # Extract the build number (the first capturing group in the regex)
         build_number = match.group(1)
         return int(build_number)
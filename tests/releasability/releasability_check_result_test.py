@@ -37,3 +37,15 @@ class ReleasabilityCheckResultTest(unittest.TestCase):
         output = str(failed_check)
 
         self.assertEqual(output, "✓ emacs vs vim  - choose your battle")
+
+    def test_to_string_method_of_unknown_state_check_should_print_expected_output(self):
+        unknown_check = ReleasabilityCheckResult(
+            name="mystery check",
+            message="what happened",
+            state="SOMETHING_ELSE"
+        )
+
+        output = str(unknown_check)
+
+        self.assertEqual(output, "❓ mystery check  - what happened")
+        self.assertFalse(unknown_check.passed)
@@ -1,8 +1,15 @@
 import ast
+import contextlib
 import copy
+import io
 import unittest
 from unittest import mock
 from unittest.mock import patch, MagicMock
+
+import boto3
+from botocore.awsrequest import AWSResponse
+from botocore.exceptions import ClientError
+
 from releasability.releasability_service import ReleasabilityService, CouldNotRetrieveReleasabilityCheckResultsException
 
 
@@ -61,6 +68,86 @@ class ReleasabilityTest(unittest.TestCase):
             assert sns_query_content['responseToARN'] is not None
             assert sns_query_content['vcsRevision'] == sha
 
+    def test_start_releasability_checks_should_create_the_sns_client_with_retry_configuration(self):
+        session = MagicMock()
+
+        with patch('boto3.Session', return_value=session):
+            releasability = ReleasabilityService()
+
+            releasability.start_releasability_checks(
+                "sonar", "sonar-dummy", "feat/some", "5.4.3.542", "434343443efdcaaa123232"
+            )
+
+            session.client.assert_called_with("sns", config=ReleasabilityService.AWS_CLIENT_CONFIG)
+
+    def test_get_aws_account_id_should_create_the_sts_client_with_retry_configuration(self):
+        with patch('boto3.Session', return_value=MagicMock()):
+            with patch('boto3.client') as mock_boto3_client:
+                mock_boto3_client.return_value.get_caller_identity.return_value = {'Account': '123456789012'}
+
+                releasability = ReleasabilityService()
+
+                mock_boto3_client.assert_called_once_with('sts', config=ReleasabilityService.AWS_CLIENT_CONFIG)
+                assert ':123456789012:' in releasability.TRIGGER_TOPIC_ARN
+
+    @mock.patch('time.sleep')
+    def test_start_releasability_checks_should_retry_publish_given_sns_is_unavailable_once(self, mock_sleep):
+        session = boto3.Session(aws_access_key_id='testing', aws_secret_access_key='testing', region_name='eu-west-1')
+        http_responses = [
+            self._build_http_response(503, b''),
+            self._build_http_response(
+                200,
+                b'<PublishResponse xmlns="http://sns.amazonaws.com/doc/2010-03-31/">'
+                b'<PublishResult><MessageId>some-message-id</MessageId></PublishResult>'
+                b'<ResponseMetadata><RequestId>some-request-id</RequestId></ResponseMetadata>'
+                b'</PublishResponse>'
+            ),
+        ]
+        sent_requests = []
+
+        def send(request, **kwargs):
+            sent_requests.append(request)
+            return http_responses.pop(0)
+
+        with patch('boto3.Session', return_value=session):
+            with patch.object(ReleasabilityService, '_get_aws_account_id', return_value='123456789012'):
+                releasability = ReleasabilityService()
+                releasability._get_client('sns').meta.events.register('before-send.sns.Publish', send)
+
+                releasability.start_releasability_checks(
+                    "sonar", "sonar-dummy", "feat/some", "5.4.3.542", "434343443efdcaaa123232"
+                )
+
+        self.assertEqual(len(sent_requests), 2)
+        self.assertEqual(http_responses, [])
+
+    @mock.patch('time.sleep')
+    def test_start_releasability_checks_should_stop_retrying_publish_given_sns_stays_unavailable(self, mock_sleep):
+        session = boto3.Session(aws_access_key_id='testing', aws_secret_access_key='testing', region_name='eu-west-1')
+        sent_requests = []
+
+        def send(request, **kwargs):
+            sent_requests.append(request)
+            return self._build_http_response(503, b'')
+
+        with patch('boto3.Session', return_value=session):
+            with patch.object(ReleasabilityService, '_get_aws_account_id', return_value='123456789012'):
+                releasability = ReleasabilityService()
+                releasability._get_client('sns').meta.events.register('before-send.sns.Publish', send)
+
+                with self.assertRaises(ClientError):
+                    releasability.start_releasability_checks(
+                        "sonar", "sonar-dummy", "feat/some", "5.4.3.542", "434343443efdcaaa123232"
+                    )
+
+        self.assertEqual(len(sent_requests), ReleasabilityService.AWS_CLIENT_MAX_ATTEMPTS)
+
+    @staticmethod
+    def _build_http_response(status_code: int, body: bytes) -> AWSResponse:
+        raw = MagicMock()
+        raw.stream.return_value = [body]
+        return AWSResponse('https://sns.eu-west-1.amazonaws.com/', status_code, {}, raw)
+
     def test_start_releasability_checks_should_return_a_correlation_id_after_invokation(self):
         session = MagicMock()
         mocked_sns_client = MagicMock()
@@ -206,6 +293,74 @@ class ReleasabilityTest(unittest.TestCase):
 
         self.assertEqual(len(filtered_messages), 2)
 
+    @mock.patch('boto3.Session.client')
+    def test_fetch_check_results_should_reuse_the_sqs_client_across_polls(self, mock_client):
+        mock_client.return_value.receive_message.return_value = {}
+
+        releasability = ReleasabilityService()
+        mock_client.reset_mock()
+
+        releasability._fetch_check_results()
+        releasability._fetch_check_results()
+
+        mock_client.assert_called_once_with('sqs', config=ReleasabilityService.AWS_CLIENT_CONFIG)
+        self.assertEqual(mock_client.return_value.receive_message.call_count, 2)
+
+    @mock.patch('boto3.Session.client')
+    def test_delete_messages_should_delete_messages_by_batches(self, mock_client):
+        mock_sqs_client = mock_client.return_value
+        mock_sqs_client.delete_message_batch.return_value = {"Successful": []}
+
+        releasability = ReleasabilityService()
+
+        batch_size = ReleasabilityService.SQS_MAX_DELETED_MESSAGES_AT_A_TIME
+        messages = [{"ReceiptHandle": f"receipt-handle-{index}"} for index in range(batch_size + 2)]
+
+        releasability._delete_messages(messages)
+
+        self.assertEqual(mock_sqs_client.delete_message_batch.call_count, 2)
+        first_batch = mock_sqs_client.delete_message_batch.call_args_list[0][1]['Entries']
+        last_batch = mock_sqs_client.delete_message_batch.call_args_list[1][1]['Entries']
+        self.assertEqual(len(first_batch), batch_size)
+        self.assertEqual(last_batch, [
+            {"Id": str(batch_size), "ReceiptHandle": f"receipt-handle-{batch_size}"},
+            {"Id": str(batch_size + 1), "ReceiptHandle": f"receipt-handle-{batch_size + 1}"},
+        ])
+        mock_sqs_client.delete_message.assert_not_called()
+
+    @mock.patch('boto3.Session.client')
+    def test_delete_messages_should_warn_about_the_message_given_its_deletion_failed(self, mock_client):
+        mock_sqs_client = mock_client.return_value
+        mock_sqs_client.delete_message_batch.return_value = {
+            "Successful": [{"Id": "0"}],
+            "Failed": [{"Id": "1", "SenderFault": False, "Code": "InternalError", "Message": "try again"}],
+        }
+
+        releasability = ReleasabilityService()
+
+        messages = [
+            {"checkName": "Jira", "ReceiptHandle": "receipt-handle-jira"},
+            {"checkName": "QA", "ReceiptHandle": "receipt-handle-qa"},
+        ]
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            releasability._delete_messages(messages)
+
+        self.assertIn("QA result message", output.getvalue())
+        self.assertIn("receipt-handle-qa", output.getvalue())
+        self.assertIn("InternalError try again", output.getvalue())
+        self.assertNotIn("receipt-handle-jira", output.getvalue())
+
+    @mock.patch('boto3.Session.client')
+    def test_delete_messages_should_not_call_sqs_given_there_is_no_message(self, mock_client):
+        releasability = ReleasabilityService()
+        mock_client.reset_mock()
+
+        releasability._delete_messages([])
+
+        mock_client.assert_not_called()
+
     @mock.patch('boto3.Session.client')
     def test_get_check_results_should_return_a_list_of_the_same_size_as_the_one_received_from_filtered_check_results(self, mock_session):
 
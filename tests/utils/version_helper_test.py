@@ -52,6 +52,7 @@ class VersionHelperTest(unittest.TestCase):
         '4+3.2.1000',
         'proj--3.2.1+1234',
         'proj-3.2.1-MX+1234',
+        '3.2.1.1234\n',
     ])
     def test_is_valid_sonar_version_should_raise_exception_given_invalid_versions(self, invalid_version):
         with self.assertRaises(ValueError):